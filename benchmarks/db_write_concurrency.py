@@ -0,0 +1,175 @@
+"""Concurrent score-save throughput against SQLite, default settings vs the tuned pragmas.
+
+Starts several worker processes (like gunicorn workers), each saving hole scores to its own
+round through save_round_scores() - the same compare-and-swap, HoleScore, handicap and
+achievement writes the score API makes - while reader processes page through round history.
+Runs once with SQLite's stock settings (rollback journal, synchronous=FULL, no busy timeout,
+so a blocked connection fails with "database is locked" at once) and once with the app's tuned
+defaults (WAL, synchronous=NORMAL, a 5s busy timeout, ...), then prints both.
+
+    python benchmarks/db_write_concurrency.py --writers 8 --readers 2 --seconds 10
+    python benchmarks/db_write_concurrency.py --json results.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Environment for each configuration; anything unset falls back to the app's defaults.
+CONFIGURATIONS = {
+    'sqlite-defaults': {
+        'SQLITE_JOURNAL_MODE': 'DELETE',
+        'SQLITE_SYNCHRONOUS': 'FULL',
+        'SQLITE_BUSY_TIMEOUT_MS': '0', # Also zeroes the sqlite3 module's own 5s connect timeout
+        'SQLITE_CACHE_SIZE_KB': '2000',
+        'SQLITE_MMAP_SIZE_BYTES': '0',
+    },
+    'tuned': {},
+}
+
+
+def load_app(database_url, overrides):
+    os.environ.update(overrides)
+    os.environ['DATABASE_URL'] = database_url
+    os.environ.setdefault('OPENAI_API_KEY', 'benchmark-unused')
+    sys.path.insert(0, REPO_ROOT)
+    import app as golf
+    return golf
+
+
+def seed(database_url, overrides, writers):
+    golf = load_app(database_url, overrides)
+    golf.setup_database(golf.app)
+    with golf.app.app_context():
+        course = golf.Course(name='Benchmark Links', par_string=','.join(['4'] * 18), rating=72.0, slope=113)
+        golf.db.session.add(course)
+        golf.db.session.commit()
+        round_ids = []
+        for worker in range(writers):
+            live_round = golf.Round(course_id=course.id, user_identifier=f'bench-{worker}')
+            golf.db.session.add(live_round)
+            golf.db.session.commit()
+            round_ids.append(live_round.id)
+    return round_ids
+
+
+def wait_for_start(ready, start, seconds):
+    ready.put(True)
+    start.wait()
+    return time.time() + seconds
+
+
+def writer(database_url, overrides, worker, round_id, ready, start, seconds, results):
+    golf = load_app(database_url, overrides)
+    from sqlalchemy.exc import OperationalError
+    latencies, locked = [], 0
+    deadline = wait_for_start(ready, start, seconds)
+    with golf.app.app_context():
+        while time.time() < deadline:
+            started = time.perf_counter()
+            try:
+                live_round = golf.db.session.get(golf.Round, round_id)
+                golf.save_round_scores(live_round, f'bench-{worker}', {random.randint(1, 18): random.randint(3, 7)}, notify=False)
+                latencies.append(time.perf_counter() - started)
+            except OperationalError: # "database is locked"
+                golf.db.session.rollback()
+                locked += 1
+            golf.db.session.remove()
+    results.put(('writer', latencies, locked))
+
+
+def reader(database_url, overrides, ready, start, seconds, results):
+    golf = load_app(database_url, overrides)
+    from sqlalchemy.exc import OperationalError
+    latencies, locked = [], 0
+    deadline = wait_for_start(ready, start, seconds)
+    with golf.app.app_context():
+        while time.time() < deadline:
+            started = time.perf_counter()
+            try:
+                golf.db.session.query(golf.Round.id, golf.Round.total_score, golf.Round.score_to_par)\
+                    .order_by(golf.Round.date_played.desc()).limit(25).all()
+                golf.db.session.query(golf.HoleScore.par, golf.db.func.avg(golf.HoleScore.strokes))\
+                    .group_by(golf.HoleScore.par).all()
+                latencies.append(time.perf_counter() - started)
+            except OperationalError: # "database is locked"
+                golf.db.session.rollback()
+                locked += 1
+            golf.db.session.remove()
+    results.put(('reader', latencies, locked))
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_configuration(name, overrides, args):
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as workdir:
+        database_url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        with context.Pool(1) as pool: # Seed in a child so this process never imports the app
+            round_ids = pool.apply(seed, (database_url, overrides, args.writers))
+        ready, start, results = context.Queue(), context.Event(), context.Queue()
+        shared = (ready, start, args.seconds, results)
+        processes = [context.Process(target=writer, args=(database_url, overrides, worker, round_ids[worker]) + shared)
+                     for worker in range(args.writers)]
+        processes += [context.Process(target=reader, args=(database_url, overrides) + shared)
+                      for _ in range(args.readers)]
+        for process in processes:
+            process.start()
+        for _ in processes: # Start the clock only once every process has imported the app
+            ready.get()
+        start.set()
+        collected = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+    summary = {'configuration': name, 'writers': args.writers, 'readers': args.readers, 'seconds': args.seconds}
+    for role in ('writer', 'reader'):
+        latencies = [latency for kind, values, _ in collected if kind == role for latency in values]
+        summary[role] = {
+            'operations': len(latencies),
+            'per_second': round(len(latencies) / args.seconds, 1),
+            'locked_errors': sum(locked for kind, _, locked in collected if kind == role),
+            'p50_ms': round(statistics.median(latencies) * 1000, 2) if latencies else None,
+            'p95_ms': round(percentile(latencies, 0.95) * 1000, 2) if latencies else None,
+            'p99_ms': round(percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--readers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--only', choices=sorted(CONFIGURATIONS), help="Run a single configuration.")
+    parser.add_argument('--json', metavar='PATH', help="Also write the results as JSON.")
+    args = parser.parse_args()
+
+    names = [args.only] if args.only else list(CONFIGURATIONS)
+    summaries = [run_configuration(name, CONFIGURATIONS[name], args) for name in names]
+
+    print(f"{'configuration':<16} {'role':<7} {'ops/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'locked':>7}")
+    for summary in summaries:
+        for role in ('writer', 'reader'):
+            stats = summary[role]
+            print(f"{summary['configuration']:<16} {role:<7} {stats['per_second']:>8} {stats['p50_ms'] or '-':>8} "
+                  f"{stats['p95_ms'] or '-':>8} {stats['p99_ms'] or '-':>8} {stats['locked_errors']:>7}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(summaries, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
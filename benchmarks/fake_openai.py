@@ -0,0 +1,136 @@
+"""A local stand-in for the OpenAI chat completions API, for load tests.
+
+Answers POST .../chat/completions with a canned markdown reply after a configurable delay,
+either whole or streamed as server-sent-event chunks, and reports how many calls it served
+on GET /stats. Point the app at it with OPENAI_BASE_URL=http://127.0.0.1:<port>/v1.
+
+    python benchmarks/fake_openai.py --port 8765 --latency 0.8 --chunk-delay 0.02
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REPLY_BLOCKS = [
+    "## Overall Strategy\n\nFavor the wide side of the fairway and leave a full wedge into the green.",
+    "## Club Suggestion\n\nA smooth 7 iron covers the carry with room to spare against the breeze.",
+    "## Execution Tips\n\n- Ball slightly back of center\n- Three-quarter finish\n- Commit to the target line",
+]
+
+
+def reply_text(words):
+    """Markdown of roughly `words` words, built from whole blocks so headings and lists stay intact."""
+    blocks, count = [], 0
+    while count < words:
+        block = REPLY_BLOCKS[len(blocks) % len(REPLY_BLOCKS)]
+        blocks.append(block)
+        count += len(block.split())
+    return "\n\n".join(blocks)
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency, chunk_delay, words, error_rate):
+        super().__init__(address, FakeOpenAIHandler)
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.text = reply_text(words)
+        self.error_rate = error_rate
+        self.stats = {'requests': 0, 'streamed': 0, 'errors': 0, 'in_flight': 0, 'peak_in_flight': 0}
+        self.stats_lock = threading.Lock()
+
+    def bump(self, key, amount=1):
+        with self.stats_lock:
+            self.stats[key] += amount
+            self.stats['peak_in_flight'] = max(self.stats['peak_in_flight'], self.stats['in_flight'])
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != '/stats':
+            return self.send_json(404, {'error': {'message': 'Not found'}})
+        with self.server.stats_lock:
+            self.send_json(200, dict(self.server.stats))
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        if not self.path.endswith('/chat/completions'):
+            return self.send_json(404, {'error': {'message': 'Not found'}})
+        server = self.server
+        server.bump('requests')
+        server.bump('in_flight')
+        try:
+            time.sleep(server.latency)
+            if random.random() < server.error_rate:
+                server.bump('errors')
+                return self.send_json(500, {'error': {'message': 'Injected failure', 'type': 'server_error'}})
+            if request.get('stream'):
+                server.bump('streamed')
+                self.stream_completion(request)
+            else:
+                self.send_json(200, self.completion(request))
+        finally:
+            server.bump('in_flight', -1)
+
+    def completion(self, request):
+        text = self.server.text
+        return {
+            'id': 'chatcmpl-loadtest', 'object': 'chat.completion', 'created': int(time.time()),
+            'model': request.get('model', 'gpt-4o'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': 200, 'completion_tokens': len(text.split()), 'total_tokens': 200 + len(text.split())},
+        }
+
+    def stream_completion(self, request):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        base = {'id': 'chatcmpl-loadtest', 'object': 'chat.completion.chunk', 'created': int(time.time()),
+                'model': request.get('model', 'gpt-4o')}
+        pieces = [word + ' ' for word in self.server.text.replace('\n', ' \n').split(' ')]
+        for piece in pieces:
+            chunk = dict(base, choices=[{'index': 0, 'delta': {'content': piece}, 'finish_reason': None}])
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+            time.sleep(self.server.chunk_delay)
+        chunk = dict(base, choices=[{'index': 0, 'delta': {}, 'finish_reason': 'stop'}])
+        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+        if (request.get('stream_options') or {}).get('include_usage'):
+            usage = self.completion(request)['usage']
+            self.wfile.write(f"data: {json.dumps(dict(base, choices=[], usage=usage))}\n\n".encode('utf-8'))
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.5, help="Seconds before the first byte of each reply.")
+    parser.add_argument('--chunk-delay', type=float, default=0.01, help="Seconds between streamed chunks.")
+    parser.add_argument('--words', type=int, default=60, help="Approximate length of each reply.")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of calls answered with a 500.")
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer((args.host, args.port), args.latency, args.chunk_delay, args.words, args.error_rate)
+    print(f"Fake OpenAI listening on http://{args.host}:{server.server_port}/v1", flush=True)
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,332 @@
+"""Reproducible load test for the main routes, against seeded data and a fake OpenAI server.
+
+Seeds a fresh database (benchmarks/loadtest_server.py seed), starts the fake OpenAI API
+(benchmarks/fake_openai.py) and the app (loadtest_server.py serve) as separate processes, then
+drives each scenario in turn from concurrent keep-alive clients acting as the seeded users.
+Reports p50/p95/p99 latency, time to first byte, throughput, SQL queries per request and the
+server's resident memory, and can write the results as JSON and compare against an earlier run.
+
+    python benchmarks/loadtest.py --concurrency 8 --duration 10 --output before.json
+    python benchmarks/loadtest.py --concurrency 8 --duration 10 --output after.json --compare before.json
+    python benchmarks/loadtest.py --scenarios rounds,track_round --users 200 --rounds-per-user 150
+
+AI scenarios bypass the response cache by default so every request reaches the fake upstream;
+pass --ai-cache to measure cache hits instead.
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+from datetime import datetime, timezone
+from io import BytesIO
+
+from PIL import Image, ImageDraw
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARKS_DIR)
+HOST = '127.0.0.1'
+
+
+# --- Scenarios ---
+# Each builds (method, path, body, content_type) for one request by a seeded user.
+def swing_image():
+    image = Image.new('RGB', (960, 720), (90, 150, 80))
+    draw = ImageDraw.Draw(image)
+    draw.line([(480, 120), (480, 600), (620, 300)], fill=(240, 240, 240), width=12)
+    buffer = BytesIO()
+    image.save(buffer, 'JPEG', quality=90)
+    return buffer.getvalue()
+
+SWING_IMAGE = swing_image()
+
+def multipart(fields, files):
+    boundary = f"loadtest{random.getrandbits(64):x}"
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode('utf-8'))
+    for name, (filename, content, mime_type) in files.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                     f'Content-Type: {mime_type}\r\n\r\n'.encode('utf-8') + content + b'\r\n')
+    parts.append(f'--{boundary}--\r\n'.encode('utf-8'))
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+def ai_form(args, rng, **fields):
+    if not args.ai_cache:
+        fields['bypass_cache'] = '1'
+    return urllib.parse.urlencode(fields).encode('utf-8'), 'application/x-www-form-urlencoded'
+
+def shot_advice_form(args, rng):
+    return ai_form(args, rng, situation=f"Ball in light rough, slight uphill lie, wind {rng.randint(0, 20)} mph into",
+                   yardage=str(rng.randint(90, 210)))
+
+SCENARIOS = {
+    'rounds': lambda args, user, rng: ('GET', '/rounds', None, None),
+    'track_round': lambda args, user, rng: ('GET', f"/track_round/{user['live_round_id']}", None, None),
+    'yardages': lambda args, user, rng: ('GET', '/yardages', None, None),
+    'share_scorecard': lambda args, user, rng: ('GET', f"/share_scorecard/{rng.choice(user['round_ids'])}", None, None),
+    'shot_advice': lambda args, user, rng: ('POST', '/shot_advice', *shot_advice_form(args, rng)),
+    'shot_advice_stream': lambda args, user, rng: ('POST', '/shot_advice/stream', *shot_advice_form(args, rng)),
+    'swing_analysis': lambda args, user, rng: ('POST', '/swing_analysis', *multipart(
+        dict({'notes': "Driver, tends to slice"}, **({} if args.ai_cache else {'bypass_cache': '1'})),
+        {'image_file': ('swing.jpg', SWING_IMAGE, 'image/jpeg')})),
+}
+
+
+# --- Processes ---
+def free_port():
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+def wait_until_listening(port, process, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Process exited with code {process.returncode} before listening on port {port}")
+        try:
+            socket.create_connection((HOST, port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Nothing listening on port {port} after {timeout}s")
+
+def memory_mb(pid):
+    """(current, peak) resident set size of a process in MB, from /proc; (None, None) elsewhere."""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+        return int(fields['VmRSS'].split()[0]) / 1024, int(fields['VmHWM'].split()[0]) / 1024
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+def upstream_stats(port):
+    with urllib.request.urlopen(f"http://{HOST}:{port}/stats", timeout=5) as response:
+        return json.load(response)
+
+def git_revision():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_ROOT,
+                                    capture_output=True, text=True).stdout.strip())
+        return {'commit': commit or None, 'dirty': dirty}
+    except OSError:
+        return {'commit': None, 'dirty': None}
+
+
+# --- Load Generation ---
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else None
+
+def client_loop(args, scenario, users, cookie_name, port, stop_at, request_budget, samples, worker):
+    rng = random.Random(f"{args.seed}-{scenario}-{worker}")
+    connection = http.client.HTTPConnection(HOST, port, timeout=args.timeout)
+    while time.monotonic() < stop_at:
+        with request_budget['lock']:
+            if request_budget['remaining'] is not None:
+                if request_budget['remaining'] <= 0:
+                    break
+                request_budget['remaining'] -= 1
+        user = rng.choice(users)
+        method, path, body, content_type = SCENARIOS[scenario](args, user, rng)
+        headers = {'Cookie': f"{cookie_name}={user['cookie']}"}
+        if content_type:
+            headers['Content-Type'] = content_type
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            first_byte = time.perf_counter()
+            size = len(response.read())
+            finished = time.perf_counter()
+            samples.append({'status': response.status, 'latency': finished - started, 'ttfb': first_byte - started,
+                            'bytes': size, 'queries': response.getheader('X-Loadtest-Queries')})
+        except (OSError, http.client.HTTPException) as e:
+            samples.append({'status': type(e).__name__, 'latency': time.perf_counter() - started})
+            connection.close()
+    connection.close()
+
+def run_scenario(args, scenario, users, cookie_name, server, ai_port):
+    for warmup in range(args.warmup):
+        client_loop(args, scenario, users, cookie_name, args.app_port, float('inf'),
+                    {'lock': threading.Lock(), 'remaining': 1}, [], f"warmup-{warmup}")
+    upstream_before = upstream_stats(ai_port)
+    samples = []
+    budget = {'lock': threading.Lock(), 'remaining': args.requests}
+    stop_at = time.monotonic() + (args.duration if args.requests is None else float('inf'))
+    threads = [threading.Thread(target=client_loop, args=(args, scenario, users, cookie_name, args.app_port,
+                                                          stop_at, budget, samples, worker))
+               for worker in range(args.concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    upstream_after = upstream_stats(ai_port)
+    rss_mb, _ = memory_mb(server.pid)
+
+    ok = [s for s in samples if isinstance(s['status'], int) and s['status'] < 400]
+    latencies = sorted(s['latency'] * 1000 for s in ok)
+    ttfbs = sorted(s['ttfb'] * 1000 for s in ok)
+    queries = [int(s['queries']) for s in ok if s.get('queries') is not None]
+    statuses = {}
+    for s in samples:
+        statuses[str(s['status'])] = statuses.get(str(s['status']), 0) + 1
+    return {
+        'requests': len(samples),
+        'errors': len(samples) - len(ok),
+        'status_counts': statuses,
+        'elapsed_seconds': round(elapsed, 3),
+        'throughput_rps': round(len(ok) / elapsed, 2) if elapsed else None,
+        'latency_ms': {'p50': percentile(latencies, 0.50), 'p95': percentile(latencies, 0.95),
+                       'p99': percentile(latencies, 0.99), 'max': latencies[-1] if latencies else None,
+                       'mean': sum(latencies) / len(latencies) if latencies else None},
+        'ttfb_ms': {'p50': percentile(ttfbs, 0.50), 'p95': percentile(ttfbs, 0.95)},
+        'queries_per_request': {'mean': sum(queries) / len(queries) if queries else None,
+                                'max': max(queries) if queries else None},
+        'response_bytes_mean': sum(s['bytes'] for s in ok) / len(ok) if ok else None,
+        'upstream_ai_calls': upstream_after['requests'] - upstream_before['requests'],
+        'server_rss_mb': rss_mb,
+    }
+
+
+# --- Reporting ---
+def fmt(value, digits=1):
+    return '-' if value is None else f"{value:.{digits}f}"
+
+def print_report(results):
+    print(f"\n{'scenario':<20} {'reqs':>6} {'err':>5} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'ttfb50':>8} {'queries':>8} {'ai calls':>8} {'rss MB':>7}")
+    for name, r in results['scenarios'].items():
+        print(f"{name:<20} {r['requests']:>6} {r['errors']:>5} {fmt(r['throughput_rps']):>8} "
+              f"{fmt(r['latency_ms']['p50']):>8} {fmt(r['latency_ms']['p95']):>8} {fmt(r['latency_ms']['p99']):>8} "
+              f"{fmt(r['ttfb_ms']['p50']):>8} {fmt(r['queries_per_request']['mean']):>8} "
+              f"{r['upstream_ai_calls']:>8} {fmt(r['server_rss_mb'], 0):>7}")
+    server = results['server']
+    print(f"\nServer peak RSS {fmt(server['peak_rss_mb'], 0)} MB, ready in {fmt(server['startup_seconds'], 2)}s")
+
+def change(new, old):
+    if new is None or old in (None, 0):
+        return '-'
+    return f"{(new - old) / old * 100:+.1f}%"
+
+def print_comparison(results, baseline):
+    print(f"\nCompared with {baseline['meta']['git'].get('commit') or 'baseline'}:")
+    print(f"{'scenario':<20} {'p50':>9} {'p95':>9} {'p99':>9} {'rps':>9} {'queries':>9}")
+    for name, r in results['scenarios'].items():
+        old = baseline['scenarios'].get(name)
+        if not old:
+            continue
+        print(f"{name:<20} {change(r['latency_ms']['p50'], old['latency_ms']['p50']):>9} "
+              f"{change(r['latency_ms']['p95'], old['latency_ms']['p95']):>9} "
+              f"{change(r['latency_ms']['p99'], old['latency_ms']['p99']):>9} "
+              f"{change(r['throughput_rps'], old['throughput_rps']):>9} "
+              f"{change(r['queries_per_request']['mean'], old['queries_per_request']['mean']):>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help=f"Comma-separated, from: {', '.join(SCENARIOS)}")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10, help="Seconds per scenario.")
+    parser.add_argument('--requests', type=int, help="Requests per scenario; overrides --duration.")
+    parser.add_argument('--warmup', type=int, default=3, help="Unmeasured requests before each scenario.")
+    parser.add_argument('--timeout', type=float, default=120, help="Client timeout per request, seconds.")
+    parser.add_argument('--courses', type=int, default=200)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--rounds-per-user', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--ai-latency', type=float, default=0.5, help="Fake upstream delay before replying, seconds.")
+    parser.add_argument('--ai-chunk-delay', type=float, default=0.01, help="Fake upstream delay between streamed chunks.")
+    parser.add_argument('--ai-words', type=int, default=60)
+    parser.add_argument('--ai-error-rate', type=float, default=0.0)
+    parser.add_argument('--ai-cache', action='store_true', help="Let AI scenarios use the response cache.")
+    parser.add_argument('--database-url', help="Database to seed and serve from; defaults to a temporary SQLite file.")
+    parser.add_argument('--output', help="Write the results as JSON to this path.")
+    parser.add_argument('--compare', metavar='BASELINE', help="JSON results from an earlier run to compare against.")
+    parser.add_argument('--keep-workdir', action='store_true', help="Keep the temporary database and server logs.")
+    args = parser.parse_args()
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    workdir = tempfile.mkdtemp(prefix='golf-loadtest-')
+    ai_port, args.app_port = free_port(), free_port()
+    env = dict(os.environ,
+               DATABASE_URL=args.database_url or f"sqlite:///{os.path.join(workdir, 'loadtest.db')}",
+               OPENAI_BASE_URL=f"http://{HOST}:{ai_port}/v1", OPENAI_API_KEY='loadtest',
+               SECRET_KEY='loadtest-secret', SCORECARD_CACHE_DIR=os.path.join(workdir, 'scorecards'))
+    manifest_path = os.path.join(workdir, 'manifest.json')
+    processes = []
+    try:
+        with open(os.path.join(workdir, 'fake_openai.log'), 'w') as log:
+            processes.append(subprocess.Popen(
+                [sys.executable, os.path.join(BENCHMARKS_DIR, 'fake_openai.py'), '--port', str(ai_port),
+                 '--latency', str(args.ai_latency), '--chunk-delay', str(args.ai_chunk_delay),
+                 '--words', str(args.ai_words), '--error-rate', str(args.ai_error_rate)],
+                stdout=log, stderr=subprocess.STDOUT))
+        wait_until_listening(ai_port, processes[0])
+
+        print(f"Seeding {args.courses} courses, {args.users} users x {args.rounds_per_user} rounds...", flush=True)
+        with open(os.path.join(workdir, 'seed.log'), 'w') as log:
+            subprocess.run([sys.executable, os.path.join(BENCHMARKS_DIR, 'loadtest_server.py'), 'seed',
+                            '--manifest', manifest_path, '--courses', str(args.courses), '--users', str(args.users),
+                            '--rounds-per-user', str(args.rounds_per_user), '--seed', str(args.seed)],
+                           env=env, stdout=log, stderr=subprocess.STDOUT, check=True)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        server_started = time.perf_counter()
+        with open(os.path.join(workdir, 'server.log'), 'w') as log:
+            server = subprocess.Popen([sys.executable, os.path.join(BENCHMARKS_DIR, 'loadtest_server.py'), 'serve',
+                                       '--port', str(args.app_port)], env=env, stdout=log, stderr=subprocess.STDOUT)
+        processes.append(server)
+        wait_until_listening(args.app_port, server)
+        startup_seconds = time.perf_counter() - server_started
+
+        results = {
+            'meta': {'git': git_revision(), 'timestamp': datetime.now(timezone.utc).isoformat(),
+                     'python': platform.python_version(), 'platform': platform.platform(), 'cpus': os.cpu_count(),
+                     'args': {k: v for k, v in vars(args).items() if k not in ('output', 'compare', 'app_port')}},
+            'scenarios': {},
+        }
+        for scenario in scenarios:
+            print(f"Running {scenario}...", flush=True)
+            results['scenarios'][scenario] = run_scenario(args, scenario, manifest['users'], manifest['cookie_name'],
+                                                          server, ai_port)
+        _, peak_rss_mb = memory_mb(server.pid)
+        results['server'] = {'peak_rss_mb': peak_rss_mb, 'startup_seconds': startup_seconds}
+        results['upstream'] = upstream_stats(ai_port)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+        if args.keep_workdir:
+            print(f"Kept database and logs in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(results)
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(results, json.load(f))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
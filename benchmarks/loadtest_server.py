@@ -0,0 +1,116 @@
+"""App-side half of the load test: seeds synthetic data and serves the app with per-request query counts.
+
+    DATABASE_URL=sqlite:////tmp/lt.db python benchmarks/loadtest_server.py seed --manifest /tmp/lt.json
+    DATABASE_URL=sqlite:////tmp/lt.db python benchmarks/loadtest_server.py serve --port 5055
+
+Both read the app's usual environment (DATABASE_URL, OPENAI_BASE_URL, SECRET_KEY, ...), so run
+them with the same values. benchmarks/loadtest.py drives both; they are separate processes so
+the server's memory and startup are measured on their own.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as golf
+from flask import g, has_request_context
+from sqlalchemy import event
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+
+def session_cookie(user_id):
+    """The signed Flask session cookie value that makes requests act as `user_id`."""
+    return golf.app.session_interface.get_signing_serializer(golf.app).dumps({'user_id': user_id})
+
+
+def synthetic_pars(rng):
+    pars = [4] * 18
+    for hole in rng.sample(range(18), 8):
+        pars[hole] = 3 if hole % 2 else 5
+    return pars
+
+
+def seed(args):
+    rng = random.Random(args.seed)
+    golf.setup_database(golf.app)
+    with golf.app.app_context():
+        course_rows = [(i, {'name': f"Loadtest Course {i:05d}", 'pars': synthetic_pars(rng),
+                            'rating': round(rng.uniform(68, 75), 1), 'slope': rng.randint(105, 145)})
+                       for i in range(1, args.courses + 1)]
+        golf.import_courses(course_rows)
+        courses = golf.db.session.query(golf.Course.id, golf.Course.name, golf.Course.par_string)\
+            .filter(golf.Course.name.like('Loadtest Course %')).all()
+
+        users = []
+        start = datetime(2024, 1, 1)
+        for u in range(args.users):
+            user_id = f"loadtest-{u:05d}"
+            round_rows = []
+            for r in range(args.rounds_per_user):
+                course = rng.choice(courses)
+                pars = [int(p) for p in course.par_string.split(',')]
+                round_rows.append((r + 1, {'course': course.name,
+                                           'date_played': (start + timedelta(days=r, minutes=u)).isoformat(),
+                                           'scores': [max(1, p + rng.choice((-1, 0, 0, 1, 1, 2))) for p in pars]}))
+            golf.import_rounds(round_rows, user_id)
+
+            golf.save_club_yardages(user_id, {club: 240 - 12 * i for i, club in enumerate(golf.COMMON_CLUBS)
+                                              if rng.random() < 0.8})
+            live_round = golf.Round(course_id=rng.choice(courses).id, user_identifier=user_id)
+            golf.db.session.add(live_round)
+            golf.db.session.commit()
+            golf.save_round_scores(live_round, user_id, {hole: rng.randint(3, 6) for hole in range(1, 10)}, notify=False)
+
+            round_ids = [row.id for row in golf.db.session.query(golf.Round.id)
+                         .filter_by(user_identifier=user_id, is_complete=True)]
+            users.append({'user_id': user_id, 'cookie': session_cookie(user_id),
+                          'live_round_id': live_round.id, 'round_ids': round_ids})
+
+    with open(args.manifest, 'w') as f:
+        json.dump({'cookie_name': golf.app.config['SESSION_COOKIE_NAME'], 'users': users}, f)
+    print(f"Seeded {args.courses} courses and {args.users} users with {args.rounds_per_user} rounds each", flush=True)
+
+
+def serve(args):
+    with golf.app.app_context():
+        engine = golf.db.engine
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            g.loadtest_queries = g.get('loadtest_queries', 0) + 1
+
+    @golf.app.after_request
+    def report_query_count(response):
+        # Streamed bodies run after this point, so their queries are not included.
+        response.headers['X-Loadtest-Queries'] = str(g.get('loadtest_queries', 0))
+        return response
+
+    WSGIRequestHandler.protocol_version = 'HTTP/1.1' # Keep-alive, like a production server
+    server = make_server(args.host, args.port, golf.app, threaded=True)
+    print(f"Serving on http://{args.host}:{server.server_port}", flush=True)
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+    seed_parser = commands.add_parser('seed', help="Create courses, users, rounds, yardages and live rounds.")
+    seed_parser.add_argument('--manifest', required=True, help="Where to write the seeded users and their cookies.")
+    seed_parser.add_argument('--courses', type=int, default=200)
+    seed_parser.add_argument('--users', type=int, default=50)
+    seed_parser.add_argument('--rounds-per-user', type=int, default=40)
+    seed_parser.add_argument('--seed', type=int, default=1, help="Random seed, so runs are repeatable.")
+    serve_parser = commands.add_parser('serve', help="Serve the app with a threaded server.")
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+    seed(args) if args.command == 'seed' else serve(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""Worker startup cost: cold import time, memory after import, and per-worker memory under gunicorn.
+
+Each measurement runs in fresh processes. "lazy" is a plain `import app`; "eager" also imports
+everything the app loads on first use (OpenAI SDK, markdown2, Pillow, fonts), which is what every
+worker paid at import before those became lazy. The gunicorn runs boot the real server with
+gunicorn.conf.py, with and without preload_app, and read each worker's RSS and PSS (proportional
+set size, which splits shared copy-on-write pages between the processes sharing them).
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10 --workers 4 --json startup.json
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+if sys.argv[1] == 'eager':
+    app.import_heavy_modules()
+ready = time.perf_counter()
+response = app.app.test_client().get('/')
+first_request = time.perf_counter()
+with open('/proc/self/status') as f:
+    rss_kb = next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+print(json.dumps({'import_ms': (imported - started) * 1000, 'ready_ms': (ready - started) * 1000,
+                  'first_request_ms': (first_request - ready) * 1000, 'status': response.status_code,
+                  'rss_mb': rss_kb / 1024, 'modules': len(sys.modules)}))
+"""
+
+
+def measure_import(mode, runs, env):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', IMPORT_PROBE, mode], cwd=REPO_ROOT, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: round(statistics.median(sample[key] for sample in samples), 1)
+            for key in ('import_ms', 'ready_ms', 'first_request_ms', 'rss_mb', 'modules')}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def child_pids(pid):
+    children = []
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    if int(f.read().rsplit(')', 1)[1].split()[1]) == pid:
+                        children.append(int(entry))
+            except (OSError, ValueError, IndexError):
+                continue
+    return children
+
+
+def memory_mb(pid):
+    """(RSS, PSS) in MB from /proc/<pid>/smaps_rollup."""
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        fields = {line.split(':')[0]: int(line.split()[1]) for line in f if line.split(':')[0] in ('Rss', 'Pss')}
+    return fields['Rss'] / 1024, fields['Pss'] / 1024
+
+
+def measure_gunicorn(preload, workers, env):
+    port = free_port()
+    env = dict(env, GUNICORN_BIND=f"127.0.0.1:{port}", GUNICORN_WORKERS=str(workers),
+               GUNICORN_PRELOAD='1' if preload else '0')
+    started = time.perf_counter()
+    server = subprocess.Popen([sys.executable, '-m', 'gunicorn', 'app:app'], cwd=REPO_ROOT, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1).read()
+                break
+            except OSError:
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("gunicorn did not start")
+                time.sleep(0.05)
+        first_response_s = time.perf_counter() - started
+        # Wait for every worker to boot, then touch each of them a few times.
+        while len(child_pids(server.pid)) < workers and time.monotonic() < deadline:
+            time.sleep(0.05)
+        for _ in range(workers * 4):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5).read()
+        worker_memory = [memory_mb(pid) for pid in child_pids(server.pid)]
+        master_rss, master_pss = memory_mb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+    return {
+        'preload': preload,
+        'workers': len(worker_memory),
+        'first_response_s': round(first_response_s, 2),
+        'worker_rss_mb': round(statistics.mean(rss for rss, _ in worker_memory), 1),
+        'worker_pss_mb': round(statistics.mean(pss for _, pss in worker_memory), 1),
+        'total_pss_mb': round(master_pss + sum(pss for _, pss in worker_memory), 1),
+        'master_rss_mb': round(master_rss, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help="Fresh processes per import measurement.")
+    parser.add_argument('--workers', type=int, default=4, help="Gunicorn workers per server run.")
+    parser.add_argument('--skip-gunicorn', action='store_true')
+    parser.add_argument('--json', metavar='PATH', help="Also write the results as JSON.")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='golf-startup-')
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'startup.db')}",
+               OPENAI_API_KEY=os.getenv('OPENAI_API_KEY', 'startup-benchmark'))
+
+    results = {'import': {mode: measure_import(mode, args.runs, env) for mode in ('lazy', 'eager')}}
+    print(f"{'import':<8} {'import ms':>10} {'ready ms':>9} {'1st req ms':>11} {'RSS MB':>7} {'modules':>8}")
+    for mode, r in results['import'].items():
+        print(f"{mode:<8} {r['import_ms']:>10} {r['ready_ms']:>9} {r['first_request_ms']:>11} {r['rss_mb']:>7} {r['modules']:>8}")
+
+    if not args.skip_gunicorn and sys.platform.startswith('linux'):
+        results['gunicorn'] = [measure_gunicorn(preload, args.workers, env) for preload in (False, True)]
+        print(f"\n{'gunicorn':<12} {'workers':>7} {'1st resp s':>10} {'worker RSS':>10} {'worker PSS':>10} {'total PSS':>10}")
+        for r in results['gunicorn']:
+            label = 'preload' if r['preload'] else 'no preload'
+            print(f"{label:<12} {r['workers']:>7} {r['first_response_s']:>10} {r['worker_rss_mb']:>10} "
+                  f"{r['worker_pss_mb']:>10} {r['total_pss_mb']:>10}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
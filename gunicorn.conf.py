@@ -0,0 +1,35 @@
+"""Gunicorn settings, read automatically from the working directory: gunicorn app:app
+
+Run `flask --app app setup-db` once per deploy first; workers do not touch the schema.
+Every setting can be overridden from the environment (or on the command line).
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '8000')}")
+workers = int(os.getenv("GUNICORN_WORKERS", str(multiprocessing.cpu_count() * 2 + 1)))
+threads = int(os.getenv("GUNICORN_THREADS", "4")) # AI calls spend most of their time waiting on the upstream
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "90")) # Longer than AI_CALL_DEADLINE_SECONDS
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+# Import the app once in the master and fork workers from it: workers boot in milliseconds
+# and share the imported code copy-on-write instead of each holding its own copy.
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+# With preload, also import the lazily loaded AI, markdown and imaging libraries in the master,
+# so no worker pays for them on its first AI request or scorecard render.
+preload_heavy_modules = os.getenv("GUNICORN_PRELOAD_HEAVY_MODULES", "1") == "1"
+
+
+def when_ready(server):
+    if preload_app and preload_heavy_modules:
+        import app
+        app.import_heavy_modules()
+
+
+def post_fork(server, worker):
+    """Pooled database connections must not be shared across a fork; drop any the master opened."""
+    if preload_app:
+        import app
+        with app.app.app_context():
+            app.db.engine.dispose(close=False)
@@ -0,0 +1,26 @@
+"""count AI job attempts
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 02:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('ai_job', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('ai_job', schema=None) as batch_op:
+        batch_op.drop_column('attempts')
@@ -0,0 +1,106 @@
+// Renders AI responses into a container, either as a server-sent-event stream
+// or by polling a background job. In a stream, finished markdown blocks arrive
+// as HTML; the block still being written is shown as plain text, built up from
+// the appended deltas until the server closes it off.
+const AiStream = (function() {
+    function isSupported() {
+        return !!(window.ReadableStream && window.TextDecoder && 'body' in Response.prototype);
+    }
+
+    function parseEvent(frame) {
+        let event = 'message';
+        let data = '';
+        frame.split('\n').forEach(line => {
+            if (line.startsWith('event:')) event = line.slice(6).trim();
+            else if (line.startsWith('data:')) data += line.slice(5).trim();
+        });
+        return { event, data: data ? JSON.parse(data) : {} };
+    }
+
+    // Resolves once the stream is finished. Rejects if the stream could not be
+    // started, so callers can fall back to the non-streaming endpoint.
+    async function render(url, formData, target, onFirstChunk) {
+        const response = await fetch(url, { method: 'POST', body: formData });
+        if (response.status === 400) {
+            target.innerHTML = await response.text();
+            onFirstChunk();
+            return;
+        }
+        if (!response.ok || !response.body) {
+            throw new Error(`HTTP error! Status: ${response.status}`);
+        }
+
+        target.innerHTML = '';
+        const committed = document.createElement('div');
+        const pending = document.createElement('p');
+        pending.className = 'ai-response-pending';
+        target.appendChild(committed);
+        target.appendChild(pending);
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let started = false;
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const { event, data } = parseEvent(buffer.slice(0, boundary));
+                buffer = buffer.slice(boundary + 2);
+                if (!started) {
+                    started = true;
+                    onFirstChunk();
+                }
+                if (event === 'block') {
+                    committed.insertAdjacentHTML('beforeend', data.html);
+                    pending.textContent = data.pending || '';
+                } else if (event === 'pending') {
+                    pending.append(data.delta);
+                } else if (event === 'error') {
+                    committed.insertAdjacentHTML('beforeend', data.html);
+                    pending.remove();
+                    return;
+                } else if (event === 'done') {
+                    pending.remove();
+                    return;
+                }
+            }
+        }
+        pending.remove();
+        if (!started) {
+            throw new Error('Stream closed before any data arrived');
+        }
+    }
+
+    // Queues the request as a background job and polls until it finishes, or
+    // gives up after maxWait (long enough for the server to resume a job whose
+    // worker died and run it again).
+    async function runJob(url, formData, target, pollInterval = 1000, maxWait = 5 * 60 * 1000) {
+        const response = await fetch(url, { method: 'POST', body: formData });
+        let job = await response.json();
+        if (!response.ok) {
+            target.innerHTML = `<p class="error-message">${job.error}</p>`;
+            return;
+        }
+        const giveUpAt = Date.now() + maxWait;
+        while (job.status === 'queued' || job.status === 'running') {
+            if (Date.now() >= giveUpAt) {
+                target.innerHTML = '<p class="error-message">The caddie is taking too long to answer. Please try again.</p>';
+                return;
+            }
+            await new Promise(resolve => setTimeout(resolve, pollInterval));
+            const poll = await fetch(job.status_url);
+            if (!poll.ok) {
+                throw new Error(`HTTP error! Status: ${poll.status}`);
+            }
+            job = await poll.json();
+        }
+        target.innerHTML = job.html;
+    }
+
+    return { isSupported, render, runJob };
+})();
@@ -0,0 +1,109 @@
+// Typeahead for the course picker on the start page. Queries the search API as the user
+// types (debounced, cancelling stale requests) and stores the chosen course's id in the
+// hidden course_id field.
+document.addEventListener('DOMContentLoaded', function() {
+    const input = document.getElementById('courseSearch');
+    const courseId = document.getElementById('course_id');
+    const results = document.getElementById('courseResults');
+    const DEBOUNCE_MS = 150;
+    let timer = null;
+    let controller = null;
+    let active = -1;
+
+    function close() {
+        results.hidden = true;
+        input.setAttribute('aria-expanded', 'false');
+        active = -1;
+    }
+
+    function highlight(index) {
+        const items = results.querySelectorAll('li');
+        items.forEach((item, i) => item.classList.toggle('active', i === index));
+        active = index;
+    }
+
+    function choose(course) {
+        input.value = course.name;
+        courseId.value = course.id;
+        close();
+    }
+
+    function render(courses) {
+        results.innerHTML = '';
+        courses.forEach((course, index) => {
+            const item = document.createElement('li');
+            item.textContent = course.name;
+            item.setAttribute('role', 'option');
+            item.addEventListener('mousedown', event => {
+                event.preventDefault(); // Keep focus so blur doesn't close the list first
+                choose(course);
+            });
+            item.addEventListener('mouseenter', () => highlight(index));
+            item.course = course;
+            results.appendChild(item);
+        });
+        if (!courses.length) {
+            const empty = document.createElement('li');
+            empty.className = 'typeahead-empty';
+            empty.textContent = 'No matching courses';
+            results.appendChild(empty);
+        }
+        results.hidden = false;
+        input.setAttribute('aria-expanded', 'true');
+        active = -1;
+    }
+
+    async function search(query) {
+        if (controller) controller.abort();
+        controller = new AbortController();
+        const url = new URL(input.dataset.searchUrl, window.location.href);
+        url.searchParams.set('q', query);
+        try {
+            const response = await fetch(url, { signal: controller.signal });
+            if (!response.ok) {
+                throw new Error(`HTTP error! Status: ${response.status}`);
+            }
+            render((await response.json()).courses);
+        } catch (error) {
+            if (error.name !== 'AbortError') console.error('Error searching courses:', error);
+        }
+    }
+
+    input.addEventListener('input', () => {
+        courseId.value = '';
+        clearTimeout(timer);
+        const query = input.value.trim();
+        if (!query) {
+            close();
+            return;
+        }
+        timer = setTimeout(() => search(query), DEBOUNCE_MS);
+    });
+
+    input.addEventListener('keydown', event => {
+        const items = Array.from(results.querySelectorAll('li')).filter(item => item.course);
+        if (results.hidden || !items.length) return;
+        if (event.key === 'ArrowDown') {
+            event.preventDefault();
+            highlight((active + 1) % items.length);
+        } else if (event.key === 'ArrowUp') {
+            event.preventDefault();
+            highlight((active - 1 + items.length) % items.length);
+        } else if (event.key === 'Enter' && active >= 0) {
+            event.preventDefault();
+            choose(items[active].course);
+        } else if (event.key === 'Escape') {
+            close();
+        }
+    });
+
+    input.addEventListener('blur', close);
+
+    document.getElementById('startRoundForm').addEventListener('submit', event => {
+        if (!courseId.value) {
+            event.preventDefault();
+            input.focus();
+            if (input.value.trim()) search(input.value.trim());
+        }
+    });
+});
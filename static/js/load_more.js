@@ -0,0 +1,35 @@
+// "Load More" links on keyset-paginated lists. Without JavaScript the link opens the next
+// page; with it, the next page's items are fetched (?partial=1) and appended to the list
+// named by data-target, and the link moves on to the following cursor.
+document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('[data-load-more]').forEach(link => {
+        const list = document.getElementById(link.dataset.target);
+        link.addEventListener('click', async event => {
+            event.preventDefault();
+            if (link.classList.contains('loading')) return;
+            link.classList.add('loading');
+            try {
+                const url = new URL(link.href);
+                url.searchParams.set('partial', '1');
+                const response = await fetch(url);
+                if (!response.ok) {
+                    throw new Error(`HTTP error! Status: ${response.status}`);
+                }
+                const page = await response.json();
+                list.insertAdjacentHTML('beforeend', page.html);
+                if (page.next_cursor) {
+                    const next = new URL(link.href);
+                    next.searchParams.set('cursor', page.next_cursor);
+                    link.href = next.toString();
+                } else {
+                    link.parentElement.remove();
+                }
+            } catch (error) {
+                console.error('Error loading more items:', error);
+                window.location.href = link.href; // Fall back to the plain next page
+            } finally {
+                link.classList.remove('loading');
+            }
+        });
+    });
+});
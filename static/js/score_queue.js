@@ -0,0 +1,80 @@
+// Per-hole score edits waiting to reach the server, kept in IndexedDB so they survive
+// reloads and dead zones. Loaded by the live scorecard page and by the service worker.
+// Each edit is {round_id, sync_url, hole, strokes, edited_at}; the server keeps the most
+// recent edit per hole, so sending the same edits twice is harmless. Holes where a newer
+// edit from another device won come back in the response's skipped_holes.
+const ScoreQueue = (function() {
+    const DB_NAME = 'golf-caddie';
+    const STORE = 'score-edits';
+    let dbPromise = null;
+
+    function openDb() {
+        if (!dbPromise) {
+            dbPromise = new Promise((resolve, reject) => {
+                const request = indexedDB.open(DB_NAME, 1);
+                request.onupgradeneeded = () => {
+                    const store = request.result.createObjectStore(STORE, { keyPath: 'id', autoIncrement: true });
+                    store.createIndex('round_id', 'round_id');
+                };
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+        }
+        return dbPromise;
+    }
+
+    async function withStore(mode, fn) {
+        const db = await openDb();
+        return new Promise((resolve, reject) => {
+            const tx = db.transaction(STORE, mode);
+            const request = fn(tx.objectStore(STORE));
+            tx.oncomplete = () => resolve(request ? request.result : undefined);
+            tx.onerror = () => reject(tx.error);
+        });
+    }
+
+    function add(edit) {
+        return withStore('readwrite', store => store.add(edit));
+    }
+
+    function pending(roundId) {
+        return withStore('readonly', store =>
+            roundId === undefined ? store.getAll() : store.index('round_id').getAll(roundId));
+    }
+
+    function remove(ids) {
+        return withStore('readwrite', store => { ids.forEach(id => store.delete(id)); });
+    }
+
+    // Sends every queued edit for a round in one request. Resolves with the server's
+    // totals, or null if nothing was queued; rejects if the server could not be reached.
+    async function sync(roundId) {
+        const edits = await pending(roundId);
+        if (!edits.length) return null;
+        const response = await fetch(edits[0].sync_url, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                edits: edits.map(({ hole, strokes, edited_at }) => ({ hole, strokes, edited_at })),
+                sent_at: Date.now() // Lets the server correct edited_at for this device's clock
+            })
+        });
+        if (response.status === 400 || response.status === 403 || response.status === 404) {
+            await remove(edits.map(edit => edit.id)); // Will never apply; don't retry forever
+        }
+        if (!response.ok) {
+            throw new Error(`HTTP error! Status: ${response.status}`);
+        }
+        await remove(edits.map(edit => edit.id));
+        return response.json();
+    }
+
+    async function syncAll() {
+        const roundIds = new Set((await pending()).map(edit => edit.round_id));
+        for (const roundId of roundIds) {
+            await sync(roundId);
+        }
+    }
+
+    return { add, pending, sync, syncAll };
+})();
@@ -0,0 +1,85 @@
+// Service worker for offline round tracking. Live scorecard pages are fetched
+// network-first with a short timeout and fall back to the last cached copy; static
+// assets are served from the cache and refreshed in the background. Queued score
+// edits are flushed on Background Sync.
+importScripts('/static/js/score_queue.js');
+
+const CACHE_NAME = 'golf-caddie-v1';
+const PRECACHE_URLS = ['/static/css/style.css', '/static/js/score_queue.js'];
+const NETWORK_TIMEOUT_MS = 3000;
+
+self.addEventListener('install', event => {
+    event.waitUntil(caches.open(CACHE_NAME).then(cache => cache.addAll(PRECACHE_URLS)));
+    self.skipWaiting();
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys.filter(key => key !== CACHE_NAME).map(key => caches.delete(key))))
+            .then(() => self.clients.claim())
+    );
+});
+
+function networkWithTimeout(request) {
+    return new Promise((resolve, reject) => {
+        const timer = setTimeout(() => reject(new Error('Network timeout')), NETWORK_TIMEOUT_MS);
+        fetch(request).then(response => {
+            clearTimeout(timer);
+            resolve(response);
+        }, error => {
+            clearTimeout(timer);
+            reject(error);
+        });
+    });
+}
+
+async function roundPage(request) {
+    const cache = await caches.open(CACHE_NAME);
+    try {
+        const response = await networkWithTimeout(request);
+        if (response.ok) {
+            cache.put(request, response.clone());
+        }
+        return response;
+    } catch (error) {
+        const cached = await cache.match(request);
+        if (cached) return cached;
+        throw error;
+    }
+}
+
+// Stale-while-revalidate: answer from the cache immediately, refresh it in the background.
+async function staticAsset(request) {
+    const cache = await caches.open(CACHE_NAME);
+    const cached = await cache.match(request);
+    const refresh = fetch(request).then(response => {
+        if (response.ok) {
+            cache.put(request, response.clone());
+        }
+        return response;
+    });
+    if (cached) {
+        refresh.catch(() => {});
+        return cached;
+    }
+    return refresh;
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== self.location.origin) return;
+
+    if (request.mode === 'navigate' && url.pathname.startsWith('/track_round/')) {
+        event.respondWith(roundPage(request));
+    } else if (url.pathname.startsWith('/static/')) {
+        event.respondWith(staticAsset(request));
+    }
+});
+
+self.addEventListener('sync', event => {
+    if (event.tag === 'score-sync') {
+        event.waitUntil(ScoreQueue.syncAll());
+    }
+});